@@ -1,19 +1,79 @@
-import json
 from datetime import datetime
-from colorama import Fore, Style, init
-from prettytable import PrettyTable
 import random
+import bisect
+from collections import defaultdict
 import getpass
 import os
-from cryptography.fernet import Fernet
-import speech_recognition as sr
-import pyttsx3
-from fpdf import FPDF
-import markdown
+import sys
+import shutil
+import mmap
+import io
+import multiprocessing
+
+# Check for required libraries
+try:
+    import orjson
+    from colorama import Fore, Style, init
+    from prettytable import PrettyTable
+    from cryptography.fernet import Fernet
+    from argon2 import PasswordHasher
+    from argon2.exceptions import InvalidHashError, VerificationError
+    import speech_recognition as sr
+    import pyttsx3
+    from fpdf import FPDF
+    from pypdf import PdfWriter
+    import markdown
+except ImportError as e:
+    print(f"Error: Required library not found - {e.name}")
+    print("Please install with: pip install colorama prettytable cryptography orjson SpeechRecognition pyttsx3 fpdf pypdf argon2-cffi markdown")
+    sys.exit(1)
 
 # Initialize colorama
 init(autoreset=True)
 
+# Colored table headers, built once
+_TBL_HEADERS = [
+    Fore.CYAN + "#", 
+    Fore.GREEN + "Date", 
+    Fore.BLUE + "Title", 
+    Fore.MAGENTA + "Mood", 
+    Fore.YELLOW + "Rating"
+]
+_SEARCH_HEADERS = [Fore.CYAN + "Date", Fore.GREEN + "Title", Fore.MAGENTA + "Mood"]
+
+# Inspirational quotes shown when writing a new entry
+_QUOTES = (
+    "The only way to do great work is to love what you do. - Steve Jobs",
+    "Life is what happens when you're busy making other plans. - John Lennon",
+    "The future belongs to those who believe in the beauty of their dreams. - Eleanor Roosevelt",
+    "In the middle of every difficulty lies opportunity. - Albert Einstein",
+    "You miss 100% of the shots you don't take. - Wayne Gretzky"
+)
+
+# Journals with at least this many entries are rendered to PDF in parallel
+_PDF_PARALLEL_THRESHOLD = 200
+
+# Argon2id hasher for stored passwords
+_PASSWORD_HASHER = PasswordHasher(time_cost=3, memory_cost=65536)
+
+# Fernet ciphers by username, so a key is only read from disk once per process
+_CIPHER_CACHE = {}
+
+def _parse_ymd(value):
+    """Parse a YYYY-MM-DD string into a date
+    
+    Zero-padded dates are sliced directly; anything else falls back to
+    strptime, so the accepted input matches strptime("%Y-%m-%d").
+    
+    Raises:
+        ValueError: If the string is not a valid YYYY-MM-DD date
+    """
+    year, month, day = value[0:4], value[5:7], value[8:10]
+    if (len(value) == 10 and value[4] == '-' and value[7] == '-'
+            and year.isdigit() and month.isdigit() and day.isdigit()):
+        return datetime(int(year), int(month), int(day)).date()
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
 class JournalEntry:
     """Class to represent a single journal entry
     
@@ -27,8 +87,11 @@ class JournalEntry:
         forgettable_thing (str): Something the user wants to forget
         date (str): Creation timestamp
     """
+    __slots__ = ('title', 'content', 'mood', 'mood_rating', 'tags', 'completed_tasks',
+                 'forgettable_thing', 'date', '_date_obj', '_mood_lc', '_tags_lc')
+    
     def __init__(self, title, content, mood, mood_rating, tags=None, 
-                 completed_tasks=None, forgettable_thing=None):
+                 completed_tasks=None, forgettable_thing=None, date=None):
         self.title = title
         self.content = content
         self.mood = mood
@@ -36,7 +99,16 @@ class JournalEntry:
         self.tags = tags if tags else []
         self.completed_tasks = completed_tasks if completed_tasks else []
         self.forgettable_thing = forgettable_thing
-        self.date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        # Lowercased copies used by search
+        self._mood_lc = mood.lower()
+        self._tags_lc = frozenset(tag.lower() for tag in self.tags)
+        if date:
+            self.date = date
+            self._date_obj = _parse_ymd(date[:10])
+        else:
+            now = datetime.now()
+            self.date = now.strftime("%Y-%m-%d %H:%M:%S")
+            self._date_obj = now.date()
         
     def display(self, show_full=False):
         """Display the journal entry
@@ -88,85 +160,317 @@ class JournalEntry:
             'date': self.date
         }
 
+def _render_entries_pdf(entries, title=None):
+    """Render a batch of entries to PDF bytes
+    
+    Kept at module level so it can run in a multiprocessing worker.
+    
+    Args:
+        entries (list): Entry dictionaries as produced by JournalEntry.to_dict
+        title (str): Optional heading for the first page
+    """
+    pdf = FPDF()
+    pdf.set_auto_page_break(auto=True, margin=15)
+    pdf.add_page()
+    pdf.set_font("Arial", size=12)
+    
+    if title:
+        pdf.cell(200, 10, txt=title, ln=1, align='C')
+    
+    for entry in entries:
+        # Lay out each entry with a single multi_cell call
+        lines = [
+            f"Date: {entry['date']}",
+            f"Title: {entry['title']}",
+            f"Mood: {entry['mood']} ({entry['mood_rating']}/10)",
+            f"Content:\n{entry['content']}"
+        ]
+        
+        if entry['tags']:
+            lines.append(f"Tags: {', '.join(entry['tags'])}")
+            
+        if entry['completed_tasks']:
+            lines.append("Completed Tasks:")
+            lines.extend(f"- {task}" for task in entry['completed_tasks'])
+                
+        lines.append("-"*50)
+        pdf.multi_cell(0, 10, txt="\n".join(lines))
+        
+    data = pdf.output(dest='S')
+    # fpdf returns a latin-1 str, fpdf2 a bytearray
+    return data.encode('latin-1') if isinstance(data, str) else bytes(data)
+
 class JournalManager:
     """Class to manage journal entries with file operations
     
+    The journal file is an append-only log: each line is a Fernet token
+    holding one record (snapshot, add, edit or delete). Loading replays the
+    log and, once it grows past twice the number of entries, the file is
+    compacted into a single snapshot record.
+    
     Attributes:
         filename (str): Path to journal data file
-        entries (list): List of JournalEntry objects
-        key (bytes): Encryption key for secure storage
+        entries (list): List of JournalEntry objects, loaded on first access
+        cipher (Fernet): Cached cipher built from the user's key on first use
         current_user (str): Currently logged in user
     """
     def __init__(self, username):
         """Initialize journal manager for a specific user"""
         self.username = username
         self.filename = f"journal_{username}.json"
-        self.key = self._get_or_create_key()
-        self.cipher = Fernet(self.key)
-        self.entries = []
-        self.load_entries()
+        self._cipher = None
+        self._entries = None
+        self._log_lines = 0
+        # Set when the log could not be replayed, so it is never overwritten
+        self._load_failed = False
+        # Set once this session writes to the journal, so logout only backs up real changes
+        self._dirty = False
+        # Search indexes mapping lowercased tag/mood and date to entry positions
+        self._tag_index = defaultdict(set)
+        self._mood_index = defaultdict(set)
+        self._date_sorted = []
+        self._table = PrettyTable()
+        self._table.field_names = _TBL_HEADERS
+        self._table.align = "l"
+        
+    @property
+    def cipher(self):
+        """Cipher for the user's key, created on first encrypt or decrypt"""
+        if self._cipher is None:
+            self._cipher = _CIPHER_CACHE.get(self.username)
+            if self._cipher is None:
+                self._cipher = _CIPHER_CACHE.setdefault(
+                    self.username, Fernet(self._get_or_create_key()))
+        return self._cipher
+        
+    @property
+    def entries(self):
+        """Entries replayed from the journal file, loaded on first access"""
+        if self._entries is None:
+            self.load_entries()
+        return self._entries
         
     def _get_or_create_key(self):
         """Get or create encryption key for user"""
         key_file = f"key_{self.username}.key"
-        if os.path.exists(key_file):
+        try:
             with open(key_file, 'rb') as f:
                 return f.read()
-        else:
+        except FileNotFoundError:
             key = Fernet.generate_key()
             with open(key_file, 'wb') as f:
                 f.write(key)
             return key
             
     def _encrypt(self, data):
-        """Encrypt data before saving"""
-        return self.cipher.encrypt(data.encode()).decode()
+        """Encrypt serialized bytes before saving"""
+        return self.cipher.encrypt(data)
         
     def _decrypt(self, data):
-        """Decrypt loaded data"""
-        return self.cipher.decrypt(data.encode()).decode()
+        """Decrypt loaded bytes"""
+        return self.cipher.decrypt(data)
         
+    def _replay(self, record):
+        """Apply a single log record to the in-memory entries"""
+        if isinstance(record, list):
+            # Journals written before the log format hold one full snapshot
+            self._entries = [JournalEntry(**entry) for entry in record]
+        elif record['op'] == 'snap':
+            self._entries = [JournalEntry(**entry) for entry in record['entries']]
+        elif record['op'] == 'add':
+            self._entries.append(JournalEntry(**record['entry']))
+        elif record['op'] == 'edit':
+            self._entries[record['idx']] = JournalEntry(**record['entry'])
+        elif record['op'] == 'del':
+            del self._entries[record['idx']]
+            
     def load_entries(self):
-        """Load entries from encrypted JSON file"""
+        """Load entries by replaying the encrypted journal log
+        
+        A record cut off at the end of the file (an append interrupted by a
+        crash) is dropped. Any other unreadable record stops the replay,
+        keeps the entries read so far and blocks saving, so the file on
+        disk is left untouched.
+        """
+        self._entries = []
+        self._log_lines = 0
+        self._load_failed = False
+        record = None
+        torn_at = None
         try:
-            if os.path.exists(self.filename):
-                with open(self.filename, 'r') as file:
-                    encrypted_data = file.read()
-                    if encrypted_data:
-                        decrypted_data = self._decrypt(encrypted_data)
-                        data = json.loads(decrypted_data)
-                        self.entries = [JournalEntry(**entry) for entry in data]
-                    else:
-                        self.entries = []
-        except (json.JSONDecodeError, Exception) as e:
+            with open(self.filename, 'rb') as file:
+                # mmap cannot map an empty file
+                if os.fstat(file.fileno()).st_size:
+                    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                        for line in iter(data.readline, b""):
+                            offset = data.tell() - len(line)
+                            token = line.strip()
+                            if not token:
+                                continue
+                            try:
+                                record = orjson.loads(self._decrypt(token))
+                                self._replay(record)
+                            except Exception as e:
+                                # Appends always end in a newline, so a final line
+                                # without one after good records is a torn write
+                                if self._log_lines and not line.endswith(b"\n"):
+                                    torn_at = offset
+                                else:
+                                    print(Fore.RED + f"Error loading journal: {str(e)}")
+                                    self._load_failed = True
+                                break
+                            self._log_lines += 1
+        except FileNotFoundError:
+            pass
+        except Exception as e:
             print(Fore.RED + f"Error loading journal: {str(e)}")
-            self.entries = []
+            self._load_failed = True
+            
+        if torn_at is not None:
+            try:
+                os.truncate(self.filename, torn_at)
+                print(Fore.YELLOW + "Dropped an incomplete record at the end of the journal.")
+            except Exception as e:
+                print(Fore.RED + f"Error repairing journal: {str(e)}")
+                self._load_failed = True
+        elif isinstance(record, list) and not self._load_failed:
+            # Rewrite legacy snapshots so later records land on new lines;
+            # if that fails, appending would glue records onto the blob
+            if not self.save_entries():
+                self._load_failed = True
+        self._build_indexes()
+        
+    def _check_writable(self):
+        """Refuse to write when the journal could not be fully loaded"""
+        if self._load_failed:
+            print(Fore.RED + "Journal could not be loaded safely; changes were not saved.")
+            return False
+        return True
+            
+    def _index_entry(self, index, entry):
+        """Add an entry at the given position to the search indexes"""
+        for tag in entry._tags_lc:
+            self._tag_index[tag].add(index)
+        self._mood_index[entry._mood_lc].add(index)
+        bisect.insort(self._date_sorted, (entry._date_obj, index))
+        
+    def _unindex_entry(self, index, entry):
+        """Remove an entry at the given position from the search indexes"""
+        for tag in entry._tags_lc:
+            self._tag_index[tag].discard(index)
+        self._mood_index[entry._mood_lc].discard(index)
+        del self._date_sorted[bisect.bisect_left(self._date_sorted, (entry._date_obj, index))]
+        
+    def _build_indexes(self):
+        """Rebuild the search indexes from the loaded entries"""
+        self._tag_index = defaultdict(set)
+        self._mood_index = defaultdict(set)
+        for index, entry in enumerate(self._entries):
+            for tag in entry._tags_lc:
+                self._tag_index[tag].add(index)
+            self._mood_index[entry._mood_lc].add(index)
+        # Sort once; insort per entry would be quadratic for out-of-order dates
+        self._date_sorted = sorted((entry._date_obj, index) for index, entry in enumerate(self._entries))
+            
+    def _append_record(self, record):
+        """Append one encrypted record to the log, compacting when it grows too long"""
+        if not self._check_writable():
+            return
+        try:
+            encrypted_data = self._encrypt(orjson.dumps(record))
+            with open(self.filename, 'ab') as file:
+                file.write(encrypted_data + b"\n")
+            self._log_lines += 1
+            self._dirty = True
+        except Exception as e:
+            print(Fore.RED + f"Error saving journal: {str(e)}")
+            return
+            
+        # Only compact once the entries have been loaded for something else
+        if self._entries is not None and self._log_lines > 2 * len(self._entries):
+            self.save_entries()
             
     def save_entries(self):
-        """Save entries to encrypted JSON file"""
+        """Compact the log into a single encrypted snapshot record
+        
+        Returns:
+            bool: True if the snapshot was written
+        """
+        if not self._check_writable():
+            return False
+        tmp_file = f"{self.filename}.tmp"
         try:
-            data = json.dumps([entry.to_dict() for entry in self.entries])
-            encrypted_data = self._encrypt(data)
-            with open(self.filename, 'w') as file:
-                file.write(encrypted_data)
-                
-            # Create backup
-            backup_file = f"backup_{self.filename}"
-            with open(backup_file, 'w') as file:
-                file.write(encrypted_data)
+            snapshot = {'op': 'snap', 'entries': [entry.to_dict() for entry in self.entries]}
+            encrypted_data = self._encrypt(orjson.dumps(snapshot))
+            # Write a private temp file and swap it in, so a crash mid-write
+            # never leaves the only copy of the journal truncated
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o600)
+            try:
+                view = memoryview(encrypted_data + b"\n")
+                while view:
+                    view = view[os.write(fd, view):]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_file, self.filename)
+            self._log_lines = 1
+            self._dirty = True
+            return True
         except Exception as e:
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
             print(Fore.RED + f"Error saving journal: {str(e)}")
+            return False
+            
+    def close(self):
+        """Back up the journal file at the end of a session
+        
+        Skipped when nothing was written, or when the journal could not be
+        read, so an unchecked or damaged file never replaces a good backup.
+        """
+        if self._load_failed or not self._dirty:
+            return
+        try:
+            shutil.copy2(self.filename, f"backup_{self.filename}")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(Fore.RED + f"Error backing up journal: {str(e)}")
+            
+    def _log_ends_cleanly(self):
+        """Check that the journal file is empty, missing or ends with a newline"""
+        try:
+            with open(self.filename, 'rb') as file:
+                if not os.fstat(file.fileno()).st_size:
+                    return True
+                file.seek(-1, os.SEEK_END)
+                return file.read(1) == b"\n"
+        except FileNotFoundError:
+            return True
             
     def add_entry(self, entry):
-        """Add a new entry"""
-        self.entries.append(entry)
-        self.save_entries()
+        """Add a new entry without loading the existing ones
+        
+        The journal is still loaded first if its last line is unterminated
+        (an old single-blob journal or a torn append), so that load_entries
+        can convert or repair it before anything is appended.
+        """
+        if self._entries is None and not self._log_ends_cleanly():
+            self.load_entries()
+        if self._entries is not None:
+            self._entries.append(entry)
+            self._index_entry(len(self._entries) - 1, entry)
+        self._append_record({'op': 'add', 'entry': entry.to_dict()})
         
     def edit_entry(self, index, new_entry):
         """Edit an existing entry"""
         if 0 <= index < len(self.entries):
+            self._unindex_entry(index, self.entries[index])
             self.entries[index] = new_entry
-            self.save_entries()
+            self._index_entry(index, new_entry)
+            self._append_record({'op': 'edit', 'idx': index, 'entry': new_entry.to_dict()})
             return True
         return False
         
@@ -174,7 +478,9 @@ class JournalManager:
         """Delete an entry"""
         if 0 <= index < len(self.entries):
             del self.entries[index]
-            self.save_entries()
+            # Later positions shift down, so rebuild rather than patch
+            self._build_indexes()
+            self._append_record({'op': 'del', 'idx': index})
             return True
         return False
         
@@ -184,26 +490,13 @@ class JournalManager:
             print(Fore.RED + "No entries found!")
             return
             
-        table = PrettyTable()
-        table.field_names = [
-            Fore.CYAN + "#", 
-            Fore.GREEN + "Date", 
-            Fore.BLUE + "Title", 
-            Fore.MAGENTA + "Mood", 
-            Fore.YELLOW + "Rating"
-        ]
-        table.align = "l"
-        
-        for i, entry in enumerate(self.entries, 1):
-            table.add_row([
-                i,
-                entry.date,
-                entry.title,
-                entry.mood,
-                f"{entry.mood_rating}/10"
-            ])
-            
-        print(table)
+        # Reuse the table so headers and alignment are only set up once
+        self._table.clear_rows()
+        self._table.add_rows([
+            [i, entry.date, entry.title, entry.mood, f"{entry.mood_rating}/10"]
+            for i, entry in enumerate(self.entries, 1)
+        ])
+        print(self._table.get_string())
         
         if show_full and self.entries:
             try:
@@ -221,35 +514,44 @@ class JournalManager:
         print("3. By Tag")
         choice = input(Fore.YELLOW + "Enter search option (1-3): ")
         
+        # Make sure entries and their indexes are loaded
+        entries = self.entries
+        
         if choice == '1':
             mood = input(Fore.MAGENTA + "Enter mood to search for: ")
-            found = [entry for entry in self.entries if mood.lower() in entry.mood.lower()]
+            mood = mood.lower()
+            # Substring match, so scan the distinct moods rather than every entry
+            matches = set()
+            for indexed_mood, positions in self._mood_index.items():
+                if mood in indexed_mood:
+                    matches |= positions
         elif choice == '2':
             start_date = input("Enter start date (YYYY-MM-DD): ")
             end_date = input("Enter end date (YYYY-MM-DD): ")
             try:
-                start = datetime.strptime(start_date, "%Y-%m-%d")
-                end = datetime.strptime(end_date, "%Y-%m-%d")
-                found = [
-                    entry for entry in self.entries 
-                    if start <= datetime.strptime(entry.date[:10], "%Y-%m-%d") <= end
-                ]
+                start = _parse_ymd(start_date)
+                end = _parse_ymd(end_date)
             except ValueError:
                 print(Fore.RED + "Invalid date format! Use YYYY-MM-DD")
                 return
+            lo = bisect.bisect_left(self._date_sorted, (start, -1))
+            hi = bisect.bisect_right(self._date_sorted, (end, len(entries)))
+            matches = [index for _, index in self._date_sorted[lo:hi]]
         elif choice == '3':
             tag = input("Enter tag to search for: ")
-            found = [entry for entry in self.entries if tag.lower() in [t.lower() for t in entry.tags]]
+            matches = self._tag_index.get(tag.lower(), ())
         else:
             print(Fore.RED + "Invalid choice!")
             return
             
+        found = [entries[index] for index in sorted(matches)]
+            
         if not found:
             print(Fore.RED + "No matching entries found!")
             return
             
         table = PrettyTable()
-        table.field_names = [Fore.CYAN + "Date", Fore.GREEN + "Title", Fore.MAGENTA + "Mood"]
+        table.field_names = _SEARCH_HEADERS
         table.align = "l"
         
         for entry in found:
@@ -258,58 +560,61 @@ class JournalManager:
         print(table)
         
     def export_to_pdf(self):
-        """Export all entries to PDF"""
-        pdf = FPDF()
-        pdf.set_auto_page_break(auto=True, margin=15)
-        pdf.add_page()
-        pdf.set_font("Arial", size=12)
+        """Export all entries to PDF
         
-        pdf.cell(200, 10, txt=f"Journal for {self.username}", ln=1, align='C')
+        Large journals on multi-core machines are split into one batch per
+        CPU, rendered in a process pool and merged, with each batch starting
+        on a new page.
+        """
+        title = f"Journal for {self.username}"
+        entries = [entry.to_dict() for entry in self.entries]
+        pdf_file = f"journal_{self.username}.pdf"
+        workers = multiprocessing.cpu_count()
         
-        for entry in self.entries:
-            pdf.cell(200, 10, txt=f"Date: {entry.date}", ln=1)
-            pdf.cell(200, 10, txt=f"Title: {entry.title}", ln=1)
-            pdf.cell(200, 10, txt=f"Mood: {entry.mood} ({entry.mood_rating}/10)", ln=1)
-            pdf.multi_cell(0, 10, txt=f"Content:\n{entry.content}")
-            
-            if entry.tags:
-                pdf.cell(0, 10, txt=f"Tags: {', '.join(entry.tags)}", ln=1)
+        if len(entries) < _PDF_PARALLEL_THRESHOLD or workers == 1:
+            with open(pdf_file, 'wb') as f:
+                f.write(_render_entries_pdf(entries, title))
+        else:
+            size = -(-len(entries) // workers)
+            batches = [
+                (entries[i:i + size], title if i == 0 else None)
+                for i in range(0, len(entries), size)
+            ]
+            with multiprocessing.Pool(workers) as pool:
+                pages = pool.starmap(_render_entries_pdf, batches)
+                
+            writer = PdfWriter()
+            for page in pages:
+                writer.append(io.BytesIO(page))
+            with open(pdf_file, 'wb') as f:
+                writer.write(f)
                 
-            if entry.completed_tasks:
-                pdf.cell(0, 10, txt="Completed Tasks:", ln=1)
-                for task in entry.completed_tasks:
-                    pdf.cell(0, 10, txt=f"- {task}", ln=1)
-                    
-            pdf.cell(0, 10, txt="-"*50, ln=1)
-            
-        pdf_file = f"journal_{self.username}.pdf"
-        pdf.output(pdf_file)
         print(Fore.GREEN + f"Journal exported to {pdf_file}!")
         
     def export_to_markdown(self):
         """Export all entries to Markdown"""
-        md_content = f"# Journal for {self.username}\n\n"
+        parts = [f"# Journal for {self.username}\n\n"]
         
         for entry in self.entries:
-            md_content += f"## {entry.title}\n"
-            md_content += f"**Date**: {entry.date}\n"
-            md_content += f"**Mood**: {entry.mood} ({entry.mood_rating}/10)\n\n"
-            md_content += f"{entry.content}\n\n"
+            parts.append(f"## {entry.title}\n")
+            parts.append(f"**Date**: {entry.date}\n")
+            parts.append(f"**Mood**: {entry.mood} ({entry.mood_rating}/10)\n\n")
+            parts.append(f"{entry.content}\n\n")
             
             if entry.tags:
-                md_content += f"**Tags**: {', '.join(entry.tags)}\n\n"
+                parts.append(f"**Tags**: {', '.join(entry.tags)}\n\n")
                 
             if entry.completed_tasks:
-                md_content += "**Completed Tasks**:\n"
+                parts.append("**Completed Tasks**:\n")
                 for task in entry.completed_tasks:
-                    md_content += f"- {task}\n"
-                md_content += "\n"
+                    parts.append(f"- {task}\n")
+                parts.append("\n")
                 
-            md_content += "---\n\n"
+            parts.append("---\n\n")
             
         md_file = f"journal_{self.username}.md"
         with open(md_file, 'w') as f:
-            f.write(md_content)
+            f.writelines(parts)
             
         print(Fore.GREEN + f"Journal exported to {md_file}!")
         
@@ -367,14 +672,7 @@ class JournalManager:
                 
     def get_random_quote(self):
         """Get random inspirational quote"""
-        quotes = [
-            "The only way to do great work is to love what you do. - Steve Jobs",
-            "Life is what happens when you're busy making other plans. - John Lennon",
-            "The future belongs to those who believe in the beauty of their dreams. - Eleanor Roosevelt",
-            "In the middle of every difficulty lies opportunity. - Albert Einstein",
-            "You miss 100% of the shots you don't take. - Wayne Gretzky"
-        ]
-        return random.choice(quotes)
+        return random.choice(_QUOTES)
 
 def authenticate_user():
     """Handle user authentication"""
@@ -393,15 +691,27 @@ def authenticate_user():
             username = input(Fore.GREEN + "Username: ")
             password = getpass.getpass(Fore.BLUE + "Password: ")
             
-            # Simple authentication - in real app, use proper hashing
-            if os.path.exists(f"user_{username}.txt"):
+            try:
                 with open(f"user_{username}.txt", 'r') as f:
                     stored_password = f.read().strip()
-                if password == stored_password:
+            except FileNotFoundError:
+                print(Fore.RED + "User not found!")
+            else:
+                try:
+                    valid = _PASSWORD_HASHER.verify(stored_password, password)
+                    rehash = _PASSWORD_HASHER.check_needs_rehash(stored_password)
+                except VerificationError:
+                    # Wrong password, or a damaged hash that still parses
+                    valid = False
+                except InvalidHashError:
+                    # Accounts created before hashing store the password in plain text
+                    valid = rehash = password == stored_password
+                if valid:
+                    if rehash:
+                        with open(f"user_{username}.txt", 'w') as f:
+                            f.write(_PASSWORD_HASHER.hash(password))
                     return username
                 print(Fore.RED + "Invalid password!")
-            else:
-                print(Fore.RED + "User not found!")
                 
         elif choice == '2':
             username = input(Fore.GREEN + "Choose username: ")
@@ -413,8 +723,13 @@ def authenticate_user():
             confirm = getpass.getpass(Fore.BLUE + "Confirm password: ")
             
             if password == confirm:
-                with open(f"user_{username}.txt", 'w') as f:
-                    f.write(password)
+                try:
+                    # 'x' fails if the user was created since the check above
+                    with open(f"user_{username}.txt", 'x') as f:
+                        f.write(_PASSWORD_HASHER.hash(password))
+                except FileExistsError:
+                    print(Fore.RED + "Username already exists!")
+                    continue
                 print(Fore.GREEN + "User created successfully!")
                 return username
             else:
@@ -587,25 +902,13 @@ def main_menu(journal_manager):
             journal_manager.export_to_markdown()
         elif choice == '9':
             print(Fore.YELLOW + "Logging out...")
+            journal_manager.close()
             break
         else:
             print(Fore.RED + "Invalid choice! Please enter a number between 1-9.")
 
 def main():
     """Main application entry point"""
-    # Check for required libraries
-    try:
-        import colorama
-        import prettytable
-        import cryptography
-        import speech_recognition
-        import pyttsx3
-        import fpdf
-    except ImportError as e:
-        print(Fore.RED + f"Error: Required library not found - {e.name}")
-        print(Fore.YELLOW + "Please install with: pip install colorama prettytable cryptography SpeechRecognition pyttsx3 fpdf")
-        return
-        
     # Main application loop
     while True:
         username = authenticate_user()